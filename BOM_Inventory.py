@@ -0,0 +1,237 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+# Bill-of-materials columns: emission_factor is kg CO2e per kg and uncertainty is
+# the per-line standard deviation as a fraction of the line's emissions
+columns = ["component", "part", "mass_kg", "material", "emission_factor", "uncertainty"]
+numeric_columns = ["mass_kg", "emission_factor", "uncertainty"]
+label_columns = ["component", "part", "material"]
+
+# Inventory components and the run_monte_carlo inputs they feed
+component_inputs = {
+    "satellite": "satellite_emissions",
+    "rectenna": "rectenna_emissions"
+}
+
+
+def _is_parquet(path):
+    return os.path.splitext(path)[1].lower() in (".parquet", ".pq")
+
+
+def _check_header(path):
+    if _is_parquet(path):
+        import pyarrow.parquet as pq
+        names = pq.ParquetFile(path).schema_arrow.names
+    else:
+        names = pd.read_csv(path, nrows=0).columns
+    missing = set(columns) - set(names)
+    if missing:
+        raise ValueError(f"Inventory is missing columns: {sorted(missing)}")
+
+
+def _read_chunks(path, chunksize):
+    if _is_parquet(path):
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+    else:
+        dtypes = {c: "float64" for c in numeric_columns}
+        dtypes.update({c: "category" for c in label_columns})
+        yield from pd.read_csv(path, usecols=columns, dtype=dtypes, chunksize=chunksize)
+
+
+def _encode(values, mapping):
+    """Codes of values in a label -> code map shared across chunks, growing it as needed."""
+    local, uniques = pd.factorize(values.astype(str))
+    lookup = np.empty(len(uniques), dtype=np.int32)
+    for i, label in enumerate(uniques):
+        lookup[i] = mapping.setdefault(label, len(mapping))
+    return lookup[local]
+
+
+def _line_stats(inventory, rows=slice(None)):
+    emissions = inventory["mass_kg"][rows] * inventory["emission_factor"][rows]
+    return emissions, (emissions * inventory["uncertainty"][rows]) ** 2
+
+
+def _add_grouped(totals, groups, weights):
+    """totals += per-group sums of weights, growing totals for newly seen groups."""
+    sums = np.bincount(groups, weights=weights, minlength=totals.size)
+    if sums.size > totals.size:
+        totals = np.append(totals, np.zeros(sums.size - totals.size))
+    totals += sums
+    return totals
+
+
+def load_inventory(path, chunksize=1_000_000):
+    """Read a CSV or Parquet bill of materials in chunks, aggregating as it goes.
+
+    Each chunk is reduced into running per-component totals straight away; only
+    the integer codes and numeric fields needed by update_lines and breakdown
+    are kept per line.
+    """
+    _check_header(path)
+    mappings = {name: {} for name in label_columns}
+    parts = {name: [] for name in label_columns + numeric_columns}
+    totals, variances = np.zeros(0), np.zeros(0)
+
+    for chunk in _read_chunks(path, chunksize):
+        lines = {name: _encode(chunk[name], mappings[name]) for name in label_columns}
+        lines.update({name: chunk[name].to_numpy(dtype=float) for name in numeric_columns})
+
+        unknown = set(mappings["component"]) - set(component_inputs)
+        if unknown:
+            raise ValueError(f"Unknown components {sorted(unknown)}, "
+                             f"expected {list(component_inputs)}")
+
+        emissions, variance = _line_stats(lines)
+        totals = _add_grouped(totals, lines["component"], emissions)
+        variances = _add_grouped(variances, lines["component"], variance)
+        for name, values in lines.items():
+            parts[name].append(values)
+
+    inventory = {}
+    for name in label_columns:
+        inventory[name] = (np.concatenate(parts[name]) if parts[name]
+                           else np.zeros(0, dtype=np.int32))
+        inventory[name + "_labels"] = np.array(list(mappings[name]), dtype=object)
+    for name in numeric_columns:
+        inventory[name] = np.concatenate(parts[name]) if parts[name] else np.zeros(0)
+        parts[name] = None
+
+    n_groups = len(mappings["component"])
+    inventory["totals"] = np.append(totals, np.zeros(n_groups - totals.size))
+    inventory["variances"] = np.append(variances, np.zeros(n_groups - variances.size))
+    return inventory
+
+
+def aggregate(inventory):
+    """Recompute the per-component sums from every line (vectorized group-by)."""
+    emissions, variance = _line_stats(inventory)
+    n_groups = len(inventory["component_labels"])
+    inventory["totals"] = np.bincount(inventory["component"], weights=emissions,
+                                      minlength=n_groups)
+    inventory["variances"] = np.bincount(inventory["component"], weights=variance,
+                                         minlength=n_groups)
+    return inventory
+
+
+def update_lines(inventory, rows, mass_kg=None, emission_factor=None, uncertainty=None):
+    """Edit line items in place and re-aggregate only the affected lines.
+
+    If a row appears more than once, its last value wins.
+    """
+    rows = np.atleast_1d(np.asarray(rows))
+
+    # Keep the last occurrence of each row so no line is counted twice
+    _, last = np.unique(rows[::-1], return_index=True)
+    last = rows.size - 1 - last
+    rows = rows[last]
+    mass_kg, emission_factor, uncertainty = (
+        values if values is None or np.ndim(values) == 0 else np.asarray(values)[last]
+        for values in (mass_kg, emission_factor, uncertainty)
+    )
+    groups = inventory["component"][rows]
+    n_groups = len(inventory["component_labels"])
+
+    # Remove the old contributions of the edited lines
+    emissions, variance = _line_stats(inventory, rows)
+    inventory["totals"] -= np.bincount(groups, weights=emissions, minlength=n_groups)
+    inventory["variances"] -= np.bincount(groups, weights=variance, minlength=n_groups)
+
+    for name, values in (("mass_kg", mass_kg), ("emission_factor", emission_factor),
+                         ("uncertainty", uncertainty)):
+        if values is not None:
+            inventory[name][rows] = values
+
+    emissions, variance = _line_stats(inventory, rows)
+    inventory["totals"] += np.bincount(groups, weights=emissions, minlength=n_groups)
+    inventory["variances"] += np.bincount(groups, weights=variance, minlength=n_groups)
+    return inventory
+
+
+def breakdown(inventory, by="material", component=None):
+    """Emissions totals (kg CO2e) grouped by material or part, optionally for one component."""
+    mask = slice(None)
+    if component is not None:
+        code = int(np.flatnonzero(inventory["component_labels"] == component)[0])
+        mask = inventory["component"] == code
+    emissions, _ = _line_stats(inventory, mask)
+    totals = np.bincount(inventory[by][mask], weights=emissions,
+                         minlength=len(inventory[by + "_labels"]))
+    return dict(zip(inventory[by + "_labels"], totals))
+
+
+def component_totals(inventory):
+    """Total emissions (kg CO2e) and std as a fraction of the total, per component."""
+    std_frac = np.sqrt(np.maximum(inventory["variances"], 0)) / inventory["totals"]
+    return {
+        label: {"total": float(total), "std_frac": float(frac)}
+        for label, total, frac in zip(inventory["component_labels"], inventory["totals"], std_frac)
+    }
+
+
+def to_monte_carlo_inputs(inventory, params):
+    """params with inventory totals substituted, and per-input std_frac for run_monte_carlo."""
+    params = dict(params)
+    std_frac = {}
+    for label, values in component_totals(inventory).items():
+        key = component_inputs[label]
+        params[key] = values["total"]
+        std_frac[key] = values["std_frac"]
+    return params, std_frac
+
+
+if __name__ == "__main__":
+    import sys
+    import tempfile
+    import time
+
+    from Monte_Carlo_Simulation import run_monte_carlo, starship_si, summarize
+
+    if len(sys.argv) > 1:
+        path = sys.argv[1]
+    else:
+        # Synthetic inventory scaled to the Si totals used in Monte_Carlo_Simulation
+        rng = np.random.default_rng(42)
+        n_lines = 2_000_000
+        component = rng.choice(["satellite", "rectenna"], size=n_lines, p=[0.3, 0.7])
+        material = rng.choice(["aluminium", "steel", "silicon", "copper", "kapton", "concrete"],
+                              size=n_lines)
+        mass = rng.lognormal(3, 1, n_lines)
+        factor = rng.lognormal(2, 0.5, n_lines)
+        target = np.where(component == "satellite", starship_si["satellite_emissions"],
+                          starship_si["rectenna_emissions"])
+        for name in ("satellite", "rectenna"):
+            mask = component == name
+            mass[mask] *= target[mask][0] / np.sum(mass[mask] * factor[mask])
+        table = pd.DataFrame({
+            "component": component,
+            "part": np.char.add("P", (np.arange(n_lines) % 50_000).astype(str)),
+            "mass_kg": mass,
+            "material": material,
+            "emission_factor": factor,
+            "uncertainty": rng.uniform(0.1, 0.5, n_lines)
+        })
+        path = os.path.join(tempfile.mkdtemp(), "inventory.csv")
+        table.to_csv(path, index=False)
+
+    start = time.perf_counter()
+    inventory = load_inventory(path)
+    print(f"Loaded and aggregated {inventory['mass_kg'].size:,} lines in "
+          f"{time.perf_counter() - start:.2f} s")
+
+    start = time.perf_counter()
+    update_lines(inventory, np.arange(1000), mass_kg=inventory["mass_kg"][:1000] * 1.1)
+    print(f"Re-aggregated after editing 1,000 lines in {time.perf_counter() - start:.4f} s")
+
+    for label, values in component_totals(inventory).items():
+        print(f"  {label}: {values['total']:,.0f} kg CO₂e (std {values['std_frac']:.2%})")
+
+    params, std_frac = to_monte_carlo_inputs(inventory, starship_si)
+    summary = summarize(run_monte_carlo(params, std_frac=std_frac))
+    print("\nStarship (Si) with inventory totals: Emissions per kWh (g CO₂e)")
+    for k, v in summary.items():
+        print(f"  {k.replace('_', ' ').capitalize()}: {v:.2f}")
@@ -0,0 +1,127 @@
+import time
+
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+
+
+# Decimation
+def _max_points_for(ax):
+    # Two points (min and max) per horizontal pixel of the axes
+    return max(2 * int(np.ceil(ax.bbox.width)), 2)
+
+
+def decimate_curves(x, Y, max_points):
+    """Min/max decimate curves sharing one x grid down to about max_points points.
+
+    Returns (X, Y) both shaped (n_curves, n_kept). Every kept point is a real data
+    point: each bucket keeps its minimum and maximum, in their original order, so
+    peaks stay visible and the line never runs backwards inside a bucket.
+    """
+    x = np.asarray(x, dtype=float)
+    Y = np.atleast_2d(np.asarray(Y, dtype=float))
+    n_curves, n_points = Y.shape
+    if n_points <= max_points:
+        return np.broadcast_to(x, Y.shape), Y
+
+    bucket = -(-n_points // max(max_points // 2, 1))
+    n_buckets = -(-n_points // bucket)
+    pad = n_buckets * bucket - n_points
+    offsets = np.arange(n_buckets) * bucket
+
+    # Pad the last bucket so it can never win the min or max
+    low = np.pad(Y, ((0, 0), (0, pad)), constant_values=np.inf)
+    high = np.pad(Y, ((0, 0), (0, pad)), constant_values=-np.inf)
+    i_min = low.reshape(n_curves, n_buckets, bucket).argmin(axis=2) + offsets
+    i_max = high.reshape(n_curves, n_buckets, bucket).argmax(axis=2) + offsets
+
+    index = np.empty((n_curves, 2 * n_buckets), dtype=np.int64)
+    index[:, 0::2] = np.minimum(i_min, i_max)
+    index[:, 1::2] = np.maximum(i_min, i_max)
+    return x[index], np.take_along_axis(Y, index, axis=1)
+
+
+# Curves
+def plot_curves(ax, x, Y, colors=None, max_points=None, linewidth=1.0, alpha=1.0,
+                label=None, autoscale=True):
+    """Draw every row of Y against x as one LineCollection."""
+    if max_points is None:
+        max_points = _max_points_for(ax)
+    X_dec, Y_dec = decimate_curves(x, Y, max_points)
+
+    segments = np.empty(Y_dec.shape + (2,))
+    segments[..., 0] = X_dec
+    segments[..., 1] = Y_dec
+
+    lines = LineCollection(segments, colors=colors, linewidths=linewidth,
+                           alpha=alpha, label=label)
+    ax.add_collection(lines, autolim=autoscale)
+    if autoscale:
+        ax.autoscale_view()
+    return lines
+
+
+# Markers
+def plot_markers(ax, x, Y, color=None, marker='o', size=20, max_points=None, **kwargs):
+    """Draw the points of every row of Y as a single scatter collection.
+
+    Long rows are thinned to the same real min/max points that plot_curves keeps.
+    """
+    if max_points is None:
+        max_points = _max_points_for(ax)
+    X_dec, Y_dec = decimate_curves(x, Y, max_points)
+    return ax.scatter(X_dec.ravel(), Y_dec.ravel(), c=color, marker=marker, s=size, **kwargs)
+
+
+# Annotations
+def annotate_points(ax, x, y, fmt="{:.2f}", xytext=(0, 8), cell_size=(30, 12),
+                    ha='center', fontsize=8, color='black'):
+    """Annotate points, dropping any that would overlap an earlier label on screen."""
+    x = np.ravel(np.asarray(x, dtype=float))
+    y = np.ravel(np.asarray(y, dtype=float))
+    finite = np.isfinite(x) & np.isfinite(y)
+    x, y = x[finite], y[finite]
+
+    # Bin labels into display-space cells roughly the size of one label
+    display = ax.transData.transform(np.column_stack([x, y]))
+    cells = np.floor(display / np.asarray(cell_size)).astype(np.int64)
+    _, keep = np.unique(cells, axis=0, return_index=True)
+    keep.sort()
+
+    return [
+        ax.annotate(fmt.format(val), (px, val), textcoords="offset points",
+                    xytext=xytext, ha=ha, fontsize=fontsize, color=color)
+        for px, val in zip(x[keep], y[keep])
+    ]
+
+
+if __name__ == "__main__":
+    from Monte_Carlo_Simulation import configurations, sample_trunc_normal
+
+    # Spaghetti plot of MC-sampled sensitivity to launch emissions
+    n_curves = 10_000
+    percent_changes = np.linspace(-60, 60, 241)
+    params = configurations["Starship (Si)"]
+
+    energy = sample_trunc_normal(params["energy_output"], size=n_curves)
+    launch = sample_trunc_normal(params["launch_emissions"], size=n_curves)
+    satellite = sample_trunc_normal(params["satellite_emissions"], size=n_curves)
+    rectenna = sample_trunc_normal(params["rectenna_emissions"], size=n_curves)
+
+    launch_adj = launch[:, None] * (1 + percent_changes / 100)
+    curves = (launch_adj + (satellite + rectenna)[:, None]) / energy[:, None] * 1000
+
+    start = time.perf_counter()
+    fig, ax = plt.subplots(figsize=(10, 6))
+    plot_curves(ax, percent_changes, curves, colors='blue', linewidth=0.5, alpha=0.02)
+    median = np.median(curves, axis=0)
+    ax.plot(percent_changes, median, color='red', label="Median")
+    annotate_points(ax, percent_changes[::40], median[::40])
+    ax.set_title("Starship (Si): Sensitivity to Launch Emissions (MC samples)")
+    ax.set_xlabel("Launch Emissions Change (%)")
+    ax.set_ylabel("g CO₂e per kWh")
+    ax.grid(True)
+    ax.legend()
+    fig.canvas.draw()
+    print(f"Rendered {n_curves} curves in {time.perf_counter() - start:.2f} s")
+    plt.show()
@@ -0,0 +1,151 @@
+import os
+import time
+
+import numpy as np
+
+from Monte_Carlo_Simulation import run_monte_carlo
+from Run_Registry import params_hash
+
+# Fixed histogram used for mergeable percentiles (g CO2e/kWh); values above
+# the last edge are only counted in the overflow bin
+histogram_edges = np.linspace(0, 200, 40_001)
+
+
+#  Mergeable accumulator
+def new_accumulator(n_outputs=1):
+    return {
+        "count": np.zeros(1, dtype=np.int64),
+        "mean": np.zeros(n_outputs),
+        "m2": np.zeros(n_outputs),
+        "min": np.full(n_outputs, np.inf),
+        "max": np.full(n_outputs, -np.inf),
+        "histogram": np.zeros((n_outputs, histogram_edges.size), dtype=np.int64)
+    }
+
+
+def accumulate(acc, values):
+    """Merge a block of values of shape (n_outputs, n) into acc (Chan et al. update)."""
+    values = np.atleast_2d(values)
+    n_b = values.shape[1]
+    n_a = int(acc["count"][0])
+    n = n_a + n_b
+    mean_b = np.mean(values, axis=1)
+    m2_b = np.sum((values - mean_b[:, None]) ** 2, axis=1)
+
+    delta = mean_b - acc["mean"]
+    acc["mean"] += delta * n_b / n
+    acc["m2"] += m2_b + delta ** 2 * n_a * n_b / n
+    acc["count"][0] = n
+    np.minimum(acc["min"], values.min(axis=1), out=acc["min"])
+    np.maximum(acc["max"], values.max(axis=1), out=acc["max"])
+
+    # Bin index per value; the last bin collects everything beyond the final edge
+    bins = np.clip(np.searchsorted(histogram_edges, values, side='right') - 1,
+                   0, histogram_edges.size - 1)
+    for i, row in enumerate(bins):
+        acc["histogram"][i] += np.bincount(row, minlength=histogram_edges.size)
+    return acc
+
+
+def _percentile(histogram, q):
+    cumulative = np.cumsum(histogram)
+    target = q / 100 * cumulative[-1]
+    i = int(np.searchsorted(cumulative, target, side='left'))
+    if i >= histogram_edges.size - 1:
+        return np.nan
+    below = cumulative[i - 1] if i > 0 else 0
+    fraction = (target - below) / histogram[i] if histogram[i] else 0.0
+    return histogram_edges[i] + fraction * (histogram_edges[i + 1] - histogram_edges[i])
+
+
+def finalize(acc):
+    """Summary statistics in the same layout as summarize(), one dict per output."""
+    count = int(acc["count"][0])
+    return [
+        {
+            "mean": acc["mean"][i],
+            "median": _percentile(acc["histogram"][i], 50),
+            "5th_percentile": _percentile(acc["histogram"][i], 5),
+            "95th_percentile": _percentile(acc["histogram"][i], 95),
+            "std": np.sqrt(acc["m2"][i] / count)
+        }
+        for i in range(acc["mean"].size)
+    ]
+
+
+#  Checkpoint files
+def save_checkpoint(path, job, next_shard, acc):
+    # Write to a temporary file first so a kill mid-write never corrupts the checkpoint
+    tmp = path + ".tmp.npz"
+    np.savez(tmp, next_shard=next_shard, **{f"job_{k}": v for k, v in job.items()},
+             **{f"acc_{k}": v for k, v in acc.items()})
+    os.replace(tmp, path)
+
+
+def load_checkpoint(path, job):
+    """(next_shard, accumulator) from path, or None if missing or for a different job."""
+    if not os.path.exists(path):
+        return None
+    with np.load(path) as data:
+        stored = {k[len("job_"):]: data[k].item() for k in data.files if k.startswith("job_")}
+        if stored != job:
+            return None
+        acc = {k[len("acc_"):]: data[k].copy() for k in data.files if k.startswith("acc_")}
+        return int(data["next_shard"]), acc
+
+
+def run_shards(evaluate_shard, n_shards, job, n_outputs, checkpoint_path,
+               checkpoint_every_s=60.0):
+    """Run evaluate_shard(shard_index) for every shard, checkpointing as it goes.
+
+    Shards are merged strictly in order and each shard seeds its own RNG from the
+    job, so a resumed run produces bit-identical results to an uninterrupted one.
+    """
+    resumed = load_checkpoint(checkpoint_path, job)
+    next_shard, acc = resumed if resumed is not None else (0, new_accumulator(n_outputs))
+
+    last_save = time.perf_counter()
+    for shard in range(next_shard, n_shards):
+        accumulate(acc, evaluate_shard(shard))
+        if time.perf_counter() - last_save >= checkpoint_every_s:
+            save_checkpoint(checkpoint_path, job, shard + 1, acc)
+            last_save = time.perf_counter()
+
+    save_checkpoint(checkpoint_path, job, n_shards, acc)
+    return acc
+
+
+def shard_rng(seed, shard):
+    # Independent, reproducible stream per shard: the RNG state is fully
+    # determined by (seed, shard), so the checkpoint only needs the shard index
+    return np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(shard,)))
+
+
+def run_monte_carlo_checkpointed(params, n_samples, checkpoint_path, shard_size=1_000_000,
+                                 seed=42, checkpoint_every_s=60.0):
+    """Sharded run_monte_carlo for one configuration that resumes from checkpoint_path."""
+    n_shards = -(-n_samples // shard_size)
+    job = {"param_hash": params_hash(params), "n_samples": int(n_samples),
+           "shard_size": int(shard_size), "seed": int(seed)}
+
+    def evaluate_shard(shard):
+        size = min(shard_size, n_samples - shard * shard_size)
+        return run_monte_carlo(params, size=size, random_state=shard_rng(seed, shard))
+
+    acc = run_shards(evaluate_shard, n_shards, job, 1, checkpoint_path, checkpoint_every_s)
+    return finalize(acc)[0]
+
+
+if __name__ == "__main__":
+    import sys
+
+    from Monte_Carlo_Simulation import configurations
+
+    n_samples = int(float(sys.argv[1])) if len(sys.argv) > 1 else 50_000_000
+    for name, params in configurations.items():
+        path = f"checkpoint_{name.replace(' ', '_').replace('(', '').replace(')', '')}.npz"
+        start = time.perf_counter()
+        summary = run_monte_carlo_checkpointed(params, n_samples, path)
+        print(f"\n{name} ({n_samples:,} samples, {time.perf_counter() - start:.1f} s)")
+        for k, v in summary.items():
+            print(f"  {k.replace('_', ' ').capitalize()}: {v:.2f}")
@@ -1,6 +1,11 @@
+import os
+
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 
+import Run_Registry
+from Monte_Carlo_Simulation import configurations
+
 # Data
 sources = [
     "Starship (Si)",
@@ -43,6 +48,26 @@ errors = [
     5
 ]
 
+# Use the latest recorded Monte Carlo runs for the SBSP entries when available
+registry_names = {
+    "Starship (Si)": "Starship (Si)",
+    "Starship (GaAs)": "Starship (GaAs)",
+    "Falcon 9 (Si)": "Falcon9 (Si)",
+    "Falcon 9 (GaAs)": "Falcon9 (GaAs)"
+}
+
+if os.path.exists(Run_Registry.registry_path):
+    registry = Run_Registry.connect()
+    # Only runs of the current parameters with the full sample count count as references
+    recorded = Run_Registry.latest_summaries(registry, registry_names.values(),
+                                             params=configurations, min_samples=10_000)
+    registry.close()
+    for i, source in enumerate(sources):
+        summary = recorded.get(registry_names.get(source))
+        if summary is not None:
+            medians[i] = summary["median"]
+            errors[i] = summary["std"]
+
 
 bar_colors = ['tab:red', 'tab:red', 'tab:green', 'tab:green'] + ['grey'] * 6
 
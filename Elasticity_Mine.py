@@ -0,0 +1,40 @@
+import numpy as np
+import matplotlib.pyplot as plt
+
+from Monte_Carlo_Simulation import configurations, run_monte_carlo
+
+# Setup
+inputs = {
+    "launch_emissions": "Launch",
+    "satellite_emissions": "Satellite",
+    "rectenna_emissions": "Rectenna",
+    "energy_output": "Energy Output"
+}
+
+# Per-sample elasticities from the same pass as the emissions samples
+elasticities = {}
+for name, params in configurations.items():
+    emissions, derivatives = run_monte_carlo(params, return_derivatives=True)
+    elasticities[name] = {key: derivatives[key]["elasticity"] for key in inputs}
+
+# Print Results
+for name, values in elasticities.items():
+    print(f"\n{name}: elasticity of g CO₂e/kWh (median [5th, 95th percentile])")
+    for key, label in inputs.items():
+        p5, p50, p95 = np.percentile(values[key], [5, 50, 95])
+        print(f"  {label}: {p50:.3f} [{p5:.3f}, {p95:.3f}]")
+
+# Plotting
+fig, axes = plt.subplots(1, 4, figsize=(18, 5), sharey=True)
+fig.suptitle("Distribution of Local Elasticities Across Monte Carlo Samples", fontsize=14)
+
+for ax, (name, values) in zip(axes, elasticities.items()):
+    ax.boxplot([values[key] for key in inputs], showfliers=False)
+    ax.set_xticks(range(1, len(inputs) + 1), list(inputs.values()), rotation=30)
+    ax.axhline(0, color='black', linewidth=0.8)
+    ax.set_title(name)
+    ax.grid(True, axis='y')
+
+axes[0].set_ylabel("Elasticity (% change in g CO₂e/kWh per % change in input)")
+plt.tight_layout(rect=[0, 0.03, 1, 0.95])
+plt.show()
@@ -0,0 +1,124 @@
+import numpy as np
+
+from Monte_Carlo_Simulation import capacity_factor, sample_bounded
+
+# System parameters
+system_capacity_MW = 2000
+system_lifetime = 30            # years
+hours_per_year = 8760           # calendar hours; eclipses are modelled explicitly
+baseline_cf = capacity_factor[0]
+
+# Uncertain inputs: (mean, std as a fraction of the mean)
+annual_degradation = (0.005, 0.25)        # fraction of output lost per year
+forced_outage_rate = (0.0, 0.25)          # probability that any given hour is lost
+
+# GEO eclipse seasons: centred on the equinoxes, up to ~72 min around local midnight.
+# Over a year this removes ~82 h, i.e. the 8677.56 h used in the sensitivity scripts.
+equinox_days = (79, 265)
+eclipse_half_season_days = 22
+eclipse_max_minutes = 72
+
+
+def eclipse_fraction(hours):
+    """Fraction of each hour of the year (0..8759) spent in Earth's shadow."""
+    hours = np.asarray(hours)
+    day = hours // 24
+    hour_of_day = hours % 24
+
+    # Eclipse duration for each day, zero outside the two eclipse seasons
+    duration = np.zeros(hours.shape)
+    for equinox in equinox_days:
+        offset = (day - equinox) / eclipse_half_season_days
+        inside = np.abs(offset) < 1
+        duration[inside] = eclipse_max_minutes / 60 * np.sqrt(1 - offset[inside] ** 2)
+
+    # The eclipse spans [-duration/2, +duration/2] around local midnight (hour 0/24)
+    half = duration / 2
+    start = hour_of_day.astype(float)
+    after_midnight = np.clip(half - start, 0, 1)
+    before_midnight = np.clip(start + 1 - (24 - half), 0, 1)
+    return after_midnight + before_midnight
+
+
+def availability_profile(hours):
+    """Deterministic hourly availability (eclipse outages only) for hours of the year."""
+    return 1 - eclipse_fraction(hours)
+
+
+def lifetime_energy_samples(size=10000, capacity_MW=system_capacity_MW,
+                            lifetime_years=system_lifetime, cf=capacity_factor,
+                            degradation=annual_degradation, outage_rate=forced_outage_rate,
+                            max_elements=20_000_000, random_state=None):
+    """Lifetime energy (kWh) per MC sample from an hourly delivery model.
+
+    Each sample gets its own capacity factor, annual degradation rate and forced
+    outage rate. Work is streamed so that no more than about max_elements values
+    are held at once; the (samples x hours) tensor is never built. Outage draws
+    come from one stream per operating year, so results do not depend on
+    max_elements.
+    """
+    rng = np.random.default_rng(random_state)
+    cf_samples = sample_bounded(*cf, size, random_state=rng)
+    degradation_samples = sample_bounded(*degradation, size, random_state=rng)
+    outage_samples = sample_bounded(*outage_rate, size, random_state=rng)
+    hourly_outages = np.any(outage_samples > 0)
+
+    # Degradation steps down once per operating year
+    years = np.arange(lifetime_years)
+    retained = (1 - degradation_samples)[:, None] ** years[None, :]
+
+    # One year of availability; every year repeats the same eclipse calendar
+    year_profile = availability_profile(np.arange(hours_per_year))
+    delivered_hours = np.zeros(size)
+
+    if hourly_outages:
+        # Fully lit hours are interchangeable, so the number lost per year is
+        # binomial; only the partially eclipsed hours need individual draws
+        full = year_profile == 1
+        n_full = int(np.count_nonzero(full))
+        partial_weights = year_profile[~full]
+        rows = max(1, max_elements // max(1, partial_weights.size))
+
+        # Each year's draws come from a stream keyed on (outage_seed, year), as in
+        # Checkpointing.shard_rng, and are chunked over samples only: a Generator
+        # fills rows in order, so the chunk size does not change the values
+        outage_seed = int(rng.integers(2 ** 63))
+        for year in years:
+            year_rng = np.random.default_rng(np.random.SeedSequence(outage_seed,
+                                                                    spawn_key=(int(year),)))
+            per_year = (n_full - year_rng.binomial(n_full, outage_samples)).astype(float)
+            for start in range(0, size, rows):
+                stop = min(start + rows, size)
+                up = (year_rng.random((stop - start, partial_weights.size))
+                      >= outage_samples[start:stop, None])
+                per_year[start:stop] += up @ partial_weights
+            delivered_hours += per_year * retained[:, year]
+    else:
+        # Without outages every year delivers the same hours, reduced in blocks
+        year_hours = np.sum(year_profile)
+        block_years = max(1, max_elements // size)
+        for start in range(0, lifetime_years, block_years):
+            delivered_hours += year_hours * np.sum(retained[:, start:start + block_years], axis=1)
+
+    return capacity_MW * 1e3 * cf_samples * delivered_hours
+
+
+if __name__ == "__main__":
+    import time
+
+    from Monte_Carlo_Simulation import configurations, run_monte_carlo, summarize
+
+    start = time.perf_counter()
+    energy = lifetime_energy_samples(size=10000, outage_rate=(0.01, 0.25), random_state=42)
+    elapsed = time.perf_counter() - start
+
+    scalar = system_capacity_MW * 1e3 * 8677.56 * system_lifetime * baseline_cf
+    print(f"Hourly model over {system_lifetime * hours_per_year:,} h x 10,000 samples "
+          f"in {elapsed:.2f} s")
+    print(f"  Mean lifetime energy: {np.mean(energy):,.0f} kWh (scalar model {scalar:,.0f} kWh)")
+
+    for name, params in configurations.items():
+        summary = summarize(run_monte_carlo(params, samples={"energy_output": energy}))
+        print(f"\n{name} Monte Carlo with hourly energy model (g CO₂e/kWh)")
+        for k, v in summary.items():
+            print(f"  {k.replace('_', ' ').capitalize()}: {v:.2f}")
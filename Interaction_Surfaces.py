@@ -0,0 +1,161 @@
+import numpy as np
+import matplotlib.pyplot as plt
+
+# Setup
+energy_output = 469_588_240_000  # kWh
+
+# Baseline emissions (kg CO2e)
+configs = {
+    "Si": {
+        "Starship": {
+            "launch": 779_976_500,
+            "satellite": 222_878_364,
+            "rectenna": 2_473_433_488
+        },
+        "Falcon 9": {
+            "launch": 2_200_916_551,
+            "satellite": 222_878_364,
+            "rectenna": 2_473_433_488
+        }
+    },
+    "GaAs": {
+        "Starship": {
+            "launch": 522_160_000,
+            "satellite": 221_113_832,
+            "rectenna": 2_473_433_488
+        },
+        "Falcon 9": {
+            "launch": 1_473_844_037,
+            "satellite": 221_113_832,
+            "rectenna": 2_473_433_488
+        }
+    }
+}
+
+# Monte Carlo means (g CO2e/kWh)
+mc_means = {
+    "Si": {
+        "Starship": 8.10,
+        "Falcon 9": 11.28
+    },
+    "GaAs": {
+        "Starship": 7.45,
+        "Falcon 9": 9.68
+    }
+}
+
+# Inputs that can be put on either axis, with their axis labels
+parameters = {
+    "launch": "Launch Emissions Change (%)",
+    "satellite": "Satellite Emissions Change (%)",
+    "rectenna": "Rectenna Emissions Change (%)",
+    "energy_output": "Energy Output Change (%)",
+    "capacity_factor": "Capacity Factor Change (%)"
+}
+
+
+def configuration_arrays(scale_to_mc_mean=True):
+    """Stack the tech/vehicle baselines into arrays of shape (n_configs,)."""
+    names, launch, satellite, rectenna, scale = [], [], [], [], []
+    for tech, vehicles in configs.items():
+        for vehicle, emissions in vehicles.items():
+            names.append((tech, vehicle))
+            launch.append(emissions["launch"])
+            satellite.append(emissions["satellite"])
+            rectenna.append(emissions["rectenna"])
+
+            # Same scaling to the MC mean as the one-at-a-time scripts
+            total = emissions["launch"] + emissions["satellite"] + emissions["rectenna"]
+            baseline_gco2e = (total / energy_output) * 1000
+            scale.append(mc_means[tech][vehicle] / baseline_gco2e if scale_to_mc_mean else 1.0)
+
+    return names, {
+        "launch": np.array(launch, dtype=float),
+        "satellite": np.array(satellite, dtype=float),
+        "rectenna": np.array(rectenna, dtype=float),
+        "scale": np.array(scale)
+    }
+
+
+def compute_surfaces(param_x, param_y, x_changes, y_changes, scale_to_mc_mean=True,
+                     max_elements=50_000_000, out=None):
+    """Evaluate g CO2e/kWh over a 2-D grid of percent changes for every configuration.
+
+    Returns (names, surfaces) where surfaces has shape (n_configs, len(y), len(x)).
+    Rows of the grid are processed in chunks of at most max_elements values, and
+    out may be a preallocated array (e.g. np.memmap) for grids that exceed memory.
+    """
+    if param_x == param_y:
+        raise ValueError("param_x and param_y must be different inputs")
+    for param in (param_x, param_y):
+        if param not in parameters:
+            raise ValueError(f"Unknown parameter '{param}', expected one of {list(parameters)}")
+
+    names, base = configuration_arrays(scale_to_mc_mean)
+    x_factor = 1 + np.asarray(x_changes, dtype=float) / 100
+    y_factor = 1 + np.asarray(y_changes, dtype=float) / 100
+    n_configs, ny, nx = len(names), y_factor.shape[0], x_factor.shape[0]
+
+    if out is None:
+        out = np.empty((n_configs, ny, nx))
+    rows_per_chunk = max(1, max_elements // (n_configs * nx))
+
+    # Per-configuration constants broadcast as (n_configs, 1, 1)
+    c = {k: v[:, None, None] for k, v in base.items()}
+    for start in range(0, ny, rows_per_chunk):
+        stop = min(start + rows_per_chunk, ny)
+        factors = {param: 1.0 for param in parameters}
+        factors[param_x] = x_factor[None, None, :]
+        factors[param_y] = y_factor[None, start:stop, None]
+
+        total_emissions = (
+            c["launch"] * factors["launch"] +
+            c["satellite"] * factors["satellite"] +
+            c["rectenna"] * factors["rectenna"]
+        ) * c["scale"]
+        varied_energy = energy_output * factors["energy_output"] * factors["capacity_factor"]
+        out[:, start:stop, :] = (total_emissions / varied_energy) * 1000
+
+    return names, out
+
+
+def plot_surfaces(names, surfaces, param_x, param_y, x_changes, y_changes, levels=12,
+                  cmap='viridis'):
+    """Heatmap with labelled contours for each precomputed configuration surface."""
+    fig, axes = plt.subplots(2, 2, figsize=(14, 11), sharex=True, sharey=True)
+    extent = [x_changes[0], x_changes[-1], y_changes[0], y_changes[-1]]
+    vmin, vmax = np.nanmin(surfaces), np.nanmax(surfaces)
+
+    for ax, (tech, vehicle), surface in zip(axes.ravel(), names, surfaces):
+        image = ax.imshow(surface, origin='lower', extent=extent, aspect='auto',
+                          cmap=cmap, vmin=vmin, vmax=vmax, interpolation='nearest')
+        contours = ax.contour(x_changes, y_changes, surface, levels=levels,
+                              colors='white', linewidths=0.8)
+        ax.clabel(contours, fmt="%.1f", fontsize=8)
+        ax.set_title(f"{vehicle} ({tech})")
+        ax.grid(True, alpha=0.3)
+
+    for ax in axes[-1]:
+        ax.set_xlabel(parameters[param_x])
+    for ax in axes[:, 0]:
+        ax.set_ylabel(parameters[param_y])
+
+    fig.colorbar(image, ax=axes, label="g CO₂e per kWh", shrink=0.8)
+    fig.suptitle(f"Interaction of {parameters[param_x].split(' Change')[0]} and "
+                 f"{parameters[param_y].split(' Change')[0]}", fontsize=14)
+    return fig
+
+
+if __name__ == "__main__":
+    x_changes = np.linspace(-60, 60, 1001)
+    y_changes = np.linspace(-60, 60, 1001)
+    names, surfaces = compute_surfaces("launch", "capacity_factor", x_changes, y_changes)
+
+    # e.g. launch emissions +40% while capacity factor falls 20%
+    ix = np.searchsorted(x_changes, 40)
+    iy = np.searchsorted(y_changes, -20)
+    for (tech, vehicle), surface in zip(names, surfaces):
+        print(f"{vehicle} ({tech}): launch +40%, CF -20% -> {surface[iy, ix]:.2f} g CO₂e/kWh")
+
+    plot_surfaces(names, surfaces, "launch", "capacity_factor", x_changes, y_changes)
+    plt.show()
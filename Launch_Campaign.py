@@ -0,0 +1,143 @@
+import numpy as np
+import matplotlib.pyplot as plt
+
+from Monte_Carlo_Simulation import (
+    configurations, run_monte_carlo, sample_trunc_normal, trunc_normal_ppf
+)
+
+# Fixed launch emission totals (kg CO2e) used by Monte_Carlo_Simulation
+baseline_launch_emissions = {
+    "Starship": {"Si": 779_976_500, "GaAs": 522_160_000},
+    "Falcon 9": {"Si": 2_200_916_551, "GaAs": 1_473_844_037}
+}
+
+# Satellite mass (kg). The Si mass is a nominal assumption; the GaAs mass is
+# scaled by the ratio of the fixed Starship launch totals.
+satellite_mass = {"Si": 10_000_000}
+satellite_mass["GaAs"] = satellite_mass["Si"] * (
+    baseline_launch_emissions["Starship"]["GaAs"] / baseline_launch_emissions["Starship"]["Si"]
+)
+
+# Vehicle capability and reuse, with the split of per-launch emissions between
+# propellant, refurbishment between flights and vehicle manufacturing
+vehicles = {
+    "Starship": {
+        "payload_kg": 100_000,
+        "flights_per_vehicle": 20,
+        "propellant_share": 0.6,
+        "refurbishment_share": 0.1
+    },
+    "Falcon 9": {
+        "payload_kg": 17_500,
+        "flights_per_vehicle": 10,
+        "propellant_share": 0.5,
+        "refurbishment_share": 0.1
+    }
+}
+
+
+def n_launches(mass_kg, payload_kg):
+    return np.ceil(np.asarray(mass_kg) / np.asarray(payload_kg))
+
+
+def emission_factors(vehicle):
+    """Per-launch emission components (kg CO2e) back-calculated from the Si baseline.
+
+    With the nominal design these reproduce the fixed Si launch total.
+    """
+    design = vehicles[vehicle]
+    launches = n_launches(satellite_mass["Si"], design["payload_kg"])
+    per_launch = baseline_launch_emissions[vehicle]["Si"] / launches
+
+    manufacturing_share = 1 - design["propellant_share"] - design["refurbishment_share"]
+    flights = design["flights_per_vehicle"]
+    return {
+        "propellant": per_launch * design["propellant_share"],
+        # The refurbishment and manufacturing shares are per launch at the nominal
+        # reuse; convert back to per reflight and per vehicle
+        "refurbishment": per_launch * design["refurbishment_share"] / (1 - 1 / flights),
+        "manufacturing": per_launch * manufacturing_share * flights
+    }
+
+
+def campaign_emissions(mass_kg, payload_kg, flights_per_vehicle, propellant,
+                       refurbishment, manufacturing):
+    """Launch campaign emissions (kg CO2e); all arguments broadcast elementwise."""
+    flights = np.maximum(np.asarray(flights_per_vehicle, dtype=float), 1)
+    per_launch = propellant + refurbishment * (1 - 1 / flights) + manufacturing / flights
+    return n_launches(mass_kg, payload_kg) * per_launch
+
+
+def sample_launch_emissions(tech, vehicle, size=10000, payload_kg=None,
+                            flights_per_vehicle=None, std_frac=0.25, random_state=None):
+    """Per-sample launch emissions for one or many vehicle designs.
+
+    payload_kg and flights_per_vehicle default to the nominal vehicle and may be
+    arrays of n_designs values, giving samples of shape (n_designs, size). All
+    designs share the same draws (common random numbers): the satellite mass and
+    emission factors are drawn once, and payload and reuse map one set of uniform
+    draws through each design's distribution, so identical designs give identical
+    samples.
+    """
+    design = vehicles[vehicle]
+    payload = np.atleast_1d(design["payload_kg"] if payload_kg is None else payload_kg)
+    flights = np.atleast_1d(design["flights_per_vehicle"] if flights_per_vehicle is None
+                            else flights_per_vehicle)
+    payload, flights = np.broadcast_arrays(payload.astype(float), flights.astype(float))
+    # Like sample_trunc_normal, fall back to the global RNG when no seed is given
+    rng = np.random.default_rng(random_state) if random_state is not None else None
+    uniform = np.random.uniform if rng is None else rng.uniform
+
+    def draw(mean):
+        return sample_trunc_normal(np.full((1, size), mean), std_frac=std_frac,
+                                   size=(1, size), random_state=rng)
+
+    def draw_per_design(means):
+        u = uniform(size=(1, size))
+        return trunc_normal_ppf(u, means[:, None], std_frac=std_frac)
+
+    factors = emission_factors(vehicle)
+    emissions = campaign_emissions(
+        mass_kg=draw(satellite_mass[tech]),
+        payload_kg=draw_per_design(payload),
+        flights_per_vehicle=draw_per_design(flights),
+        propellant=draw(factors["propellant"]),
+        refurbishment=draw(factors["refurbishment"]),
+        manufacturing=draw(factors["manufacturing"])
+    )
+    if payload_kg is None and flights_per_vehicle is None:
+        return emissions[0]
+    return emissions
+
+
+if __name__ == "__main__":
+    # Nominal campaigns against the fixed constants
+    for vehicle, design in vehicles.items():
+        factors = emission_factors(vehicle)
+        for tech in ("Si", "GaAs"):
+            nominal = campaign_emissions(satellite_mass[tech], design["payload_kg"],
+                                         design["flights_per_vehicle"], **factors)
+            print(f"{vehicle} ({tech}): {int(n_launches(satellite_mass[tech], design['payload_kg']))} "
+                  f"launches, {nominal:,.0f} kg CO₂e (fixed value "
+                  f"{baseline_launch_emissions[vehicle][tech]:,})")
+
+    # Sweep a grid of Starship-like designs through run_monte_carlo in one batched call
+    payloads = np.linspace(50_000, 200_000, 50)
+    reuse = np.arange(1, 41)
+    payload_grid, reuse_grid = np.meshgrid(payloads, reuse)
+    launch = sample_launch_emissions("Si", "Starship", size=2000,
+                                     payload_kg=payload_grid.ravel(),
+                                     flights_per_vehicle=reuse_grid.ravel())
+    results = run_monte_carlo(configurations["Starship (Si)"], size=2000,
+                              samples={"launch_emissions": launch})
+    medians = np.median(results, axis=1).reshape(payload_grid.shape)
+    print(f"\nEvaluated {launch.shape[0]:,} vehicle designs x {launch.shape[1]:,} samples")
+
+    fig, ax = plt.subplots(figsize=(10, 6))
+    contours = ax.contourf(payloads / 1000, reuse, medians, levels=20, cmap='viridis')
+    fig.colorbar(contours, ax=ax, label="Median g CO₂e per kWh")
+    ax.set_title("Starship-like Designs (Si): Median Emissions by Payload and Reuse")
+    ax.set_xlabel("Payload per launch (t)")
+    ax.set_ylabel("Flights per vehicle")
+    plt.tight_layout()
+    plt.show()
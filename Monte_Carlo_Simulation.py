@@ -1,20 +1,53 @@
 import numpy as np
 import matplotlib.pyplot as plt
+from scipy.special import ndtr, ndtri
 from scipy.stats import truncnorm
 import seaborn as sns
 import sys
+import time
 
-print(sys.executable)
-np.random.seed(42)
+import Run_Registry
+
+seed = 42
+np.random.seed(seed)
+
+# Lower bound of every truncated-normal input
+truncation_lower = 1
 
 # Monte Carlo Sampling Function using truncated normal 
-def sample_trunc_normal(mean, std_frac=0.25, size=10000):
+def sample_trunc_normal(mean, std_frac=0.25, size=10000, random_state=None):
     std_dev = mean * std_frac
-    lower, upper = 1, np.inf
+    lower, upper = truncation_lower, np.inf
     a, b = (lower - mean) / std_dev, (upper - mean) / std_dev
-    samples = truncnorm.rvs(a, b, loc=mean, scale=std_dev, size=size)
+    samples = truncnorm.rvs(a, b, loc=mean, scale=std_dev, size=size,
+                            random_state=random_state)
     return samples
 
+# Closed-form inverse CDF of the same truncated normal, for mapping uniform draws
+# to inputs. z = ndtri(u) may be passed in to be reused when the truncation is
+# negligible, which skips the inverse normal CDF.
+def trunc_normal_ppf(u, mean, std_frac=0.25, z=None):
+    std_dev = mean * std_frac
+    cut = ndtr((truncation_lower - mean) / std_dev)
+    if z is None or np.any(cut >= np.finfo(float).eps):
+        u = np.clip(cut + u * (1 - cut), np.finfo(float).tiny, 1 - np.finfo(float).eps)
+        z = ndtri(u)
+    return np.maximum(mean + std_dev * z, truncation_lower)
+
+def trunc_normal_cdf(x, mean, std_frac=0.25):
+    std_dev = mean * std_frac
+    lower, upper = truncation_lower, np.inf
+    a, b = (lower - mean) / std_dev, (upper - mean) / std_dev
+    return truncnorm.cdf(x, a, b, loc=mean, scale=std_dev)
+
+# Truncated-normal samples for fractional inputs bounded to [lower, upper]
+def sample_bounded(mean, std_frac, size, lower=0.0, upper=1.0, random_state=None):
+    if mean == 0 or std_frac == 0:
+        return np.full(size, float(mean))
+    std_dev = mean * std_frac
+    a, b = (lower - mean) / std_dev, (upper - mean) / std_dev
+    return truncnorm.rvs(a, b, loc=mean, scale=std_dev, size=size, random_state=random_state)
+
 #  Input Parameters for Si and GaAs Configurations 
 starship_si = {
     "energy_output": 469_588_240_000,
@@ -38,12 +71,40 @@ falcon9_gaas = falcon9_si.copy()
 falcon9_gaas["launch_emissions"] = 1_473_844_037
 falcon9_gaas["satellite_emissions"] = 221_113_832
 
+configurations = {
+    "Starship (Si)": starship_si,
+    "Starship (GaAs)": starship_gaas,
+    "Falcon9 (Si)": falcon9_si,
+    "Falcon9 (GaAs)": falcon9_gaas
+}
+
+# Capacity factor behind energy_output: (mean, std as a fraction of the mean)
+capacity_factor = (0.9, 0.05)
+
 # Monte Carlo Simulation Function 
-def run_monte_carlo(params):
-    energy_samples = sample_trunc_normal(params["energy_output"])
-    launch_emissions_samples = sample_trunc_normal(params["launch_emissions"])
-    satellite_emissions_samples = sample_trunc_normal(params["satellite_emissions"])
-    rectenna_emissions_samples = sample_trunc_normal(params["rectenna_emissions"])
+# Inputs in `samples` (arrays keyed like `params`) are used as given instead of
+# being drawn from the truncated normal. std_frac is a single value or a dict
+# of per-input values (missing inputs keep 0.25). With return_derivatives=True
+# the per-sample gradient and elasticity of g CO2e/kWh with respect to each
+# input are returned as well; they are exact and cost no extra model evaluations.
+# random_state (a Generator or seed) replaces the global numpy RNG when given.
+def run_monte_carlo(params, size=10000, samples=None, return_derivatives=False,
+                    std_frac=0.25, random_state=None):
+    samples = samples or {}
+    if random_state is not None:
+        random_state = np.random.default_rng(random_state)
+
+    def draw(key):
+        if key in samples:
+            return np.asarray(samples[key], dtype=float)
+        frac = std_frac.get(key, 0.25) if isinstance(std_frac, dict) else std_frac
+        return sample_trunc_normal(params[key], std_frac=frac, size=size,
+                                   random_state=random_state)
+
+    energy_samples = draw("energy_output")
+    launch_emissions_samples = draw("launch_emissions")
+    satellite_emissions_samples = draw("satellite_emissions")
+    rectenna_emissions_samples = draw("rectenna_emissions")
 
     total_emissions_samples = (
         launch_emissions_samples +
@@ -52,7 +113,25 @@ def run_monte_carlo(params):
     )
 
     emissions_g_per_kWh = (total_emissions_samples / energy_samples) * 1000
-    return emissions_g_per_kWh
+    if not return_derivatives:
+        return emissions_g_per_kWh
+
+    # g = 1000 * (launch + satellite + rectenna) / energy
+    emissions_gradient = 1000 / energy_samples
+    derivatives = {
+        "energy_output": {
+            "gradient": -emissions_g_per_kWh / energy_samples,
+            "elasticity": np.full_like(emissions_g_per_kWh, -1.0)
+        }
+    }
+    for key, component in [("launch_emissions", launch_emissions_samples),
+                           ("satellite_emissions", satellite_emissions_samples),
+                           ("rectenna_emissions", rectenna_emissions_samples)]:
+        derivatives[key] = {
+            "gradient": np.broadcast_to(emissions_gradient, emissions_g_per_kWh.shape),
+            "elasticity": component / total_emissions_samples
+        }
+    return emissions_g_per_kWh, derivatives
 
 #  Summary Statistics Function 
 def summarize(data):
@@ -64,61 +143,79 @@ def summarize(data):
         "std": np.std(data)
     }
 
-# Run Simulations 
-results = {
-    "Starship (Si)": run_monte_carlo(starship_si),
-    "Starship (GaAs)": run_monte_carlo(starship_gaas),
-    "Falcon9 (Si)": run_monte_carlo(falcon9_si),
-    "Falcon9 (GaAs)": run_monte_carlo(falcon9_gaas)
-}
-
-summaries = {k: summarize(v) for k, v in results.items()}
-
-# Print Results 
-for name, summary in summaries.items():
-    print(f"\n{name} Monte Carlo: Emissions per kWh (g CO₂e)")
-    for k, v in summary.items():
-        print(f"  {k.replace('_', ' ').capitalize()}: {v:.2f}")
-
-# Plotting: STARSHIP 
-fig_starship, axs = plt.subplots(1, 2, figsize=(14, 5))
-colors = ['skyblue', 'navy']
-starship_keys = ["Starship (Si)", "Starship (GaAs)"]
-
-for i, key in enumerate(starship_keys):
-    sns.histplot(results[key], bins='auto', kde=True, color=colors[i], ax=axs[i])
-    axs[i].axvline(summaries[key]["mean"], color='red', linestyle='dashed', linewidth=2,
-                   label=f'Mean = {summaries[key]["mean"]:.2f}')
-    axs[i].set_title(f"{key}: Emissions per kWh")
-    axs[i].set_xlabel("g CO₂e per kWh")
-    axs[i].set_ylabel("Frequency")
-    axs[i].set_xlim(0, 60)
-    axs[i].grid(True)
-    axs[i].legend()
-
-fig_starship.suptitle("Starship Monte Carlo Simulations", fontsize=16)
-plt.tight_layout(rect=[0, 0.03, 1, 0.95])
-plt.show()
-
-#  Plotting: FALCON 9 
-fig_falcon9, axs = plt.subplots(1, 2, figsize=(14, 5))
-colors = ['orange', 'darkred']
-falcon_keys = ["Falcon9 (Si)", "Falcon9 (GaAs)"]
-
-for i, key in enumerate(falcon_keys):
-    sns.histplot(results[key], bins='auto', kde=True, color=colors[i], ax=axs[i])
-    axs[i].axvline(summaries[key]["mean"], color='red', linestyle='dashed', linewidth=2,
-                   label=f'Mean = {summaries[key]["mean"]:.2f}')
-    axs[i].set_title(f"{key}: Emissions per kWh")
-    axs[i].set_xlabel("g CO₂e per kWh")
-    axs[i].set_ylabel("Frequency")
-    axs[i].set_xlim(0, 60)
-    axs[i].grid(True)
-    axs[i].legend()
-
-fig_falcon9.suptitle("Falcon 9 Monte Carlo Simulations", fontsize=16)
-plt.tight_layout(rect=[0, 0.03, 1, 0.95])
-plt.show()
-
-# Save the plot to the desktop
-plt.savefig("Falcon 9 Monte Carlo Simulations.png")
+if __name__ == "__main__":
+    print(sys.executable)
+
+    # Run Simulations, each configuration on its own stream so that
+    # run_monte_carlo(params, random_state=SeedSequence(seed, spawn_key=(stream,)))
+    # reproduces it regardless of loop order
+    std_frac = 0.25
+    results = {}
+    durations = {}
+    streams = {}
+    for stream, (name, params) in enumerate(configurations.items()):
+        start = time.perf_counter()
+        results[name] = run_monte_carlo(
+            params, std_frac=std_frac,
+            random_state=np.random.SeedSequence(seed, spawn_key=(stream,)))
+        durations[name] = time.perf_counter() - start
+        streams[name] = stream
+
+    summaries = {k: summarize(v) for k, v in results.items()}
+
+    # Record every run in the local registry
+    registry = Run_Registry.connect()
+    for name, summary in summaries.items():
+        Run_Registry.record_run(registry, name, configurations[name], summary,
+                                n_samples=len(results[name]), std_frac=std_frac, seed=seed,
+                                stream=streams[name], duration_s=durations[name])
+    registry.close()
+
+    # Print Results 
+    for name, summary in summaries.items():
+        print(f"\n{name} Monte Carlo: Emissions per kWh (g CO₂e)")
+        for k, v in summary.items():
+            print(f"  {k.replace('_', ' ').capitalize()}: {v:.2f}")
+
+    # Plotting: STARSHIP 
+    fig_starship, axs = plt.subplots(1, 2, figsize=(14, 5))
+    colors = ['skyblue', 'navy']
+    starship_keys = ["Starship (Si)", "Starship (GaAs)"]
+
+    for i, key in enumerate(starship_keys):
+        sns.histplot(results[key], bins='auto', kde=True, color=colors[i], ax=axs[i])
+        axs[i].axvline(summaries[key]["mean"], color='red', linestyle='dashed', linewidth=2,
+                       label=f'Mean = {summaries[key]["mean"]:.2f}')
+        axs[i].set_title(f"{key}: Emissions per kWh")
+        axs[i].set_xlabel("g CO₂e per kWh")
+        axs[i].set_ylabel("Frequency")
+        axs[i].set_xlim(0, 60)
+        axs[i].grid(True)
+        axs[i].legend()
+
+    fig_starship.suptitle("Starship Monte Carlo Simulations", fontsize=16)
+    plt.tight_layout(rect=[0, 0.03, 1, 0.95])
+    plt.show()
+
+    #  Plotting: FALCON 9 
+    fig_falcon9, axs = plt.subplots(1, 2, figsize=(14, 5))
+    colors = ['orange', 'darkred']
+    falcon_keys = ["Falcon9 (Si)", "Falcon9 (GaAs)"]
+
+    for i, key in enumerate(falcon_keys):
+        sns.histplot(results[key], bins='auto', kde=True, color=colors[i], ax=axs[i])
+        axs[i].axvline(summaries[key]["mean"], color='red', linestyle='dashed', linewidth=2,
+                       label=f'Mean = {summaries[key]["mean"]:.2f}')
+        axs[i].set_title(f"{key}: Emissions per kWh")
+        axs[i].set_xlabel("g CO₂e per kWh")
+        axs[i].set_ylabel("Frequency")
+        axs[i].set_xlim(0, 60)
+        axs[i].grid(True)
+        axs[i].legend()
+
+    fig_falcon9.suptitle("Falcon 9 Monte Carlo Simulations", fontsize=16)
+    plt.tight_layout(rect=[0, 0.03, 1, 0.95])
+    plt.show()
+
+    # Save the plot to the desktop
+    plt.savefig("Falcon 9 Monte Carlo Simulations.png")
@@ -0,0 +1,144 @@
+import numpy as np
+import matplotlib.pyplot as plt
+
+from Monte_Carlo_Simulation import configurations, run_monte_carlo
+
+# Reference generation sources: median and spread (g CO2e/kWh), as in Comparison_Mine
+reference_sources = {
+    "Coal": (820, 100),
+    "Natural Gas": (490, 50),
+    "Solar PV": (48, 20),
+    "Wind": (11, 10),
+    "Hydropower": (24, 10),
+    "Nuclear": (12, 5)
+}
+
+
+def lognormal_sigma(median, std):
+    """Log-space sigma of a lognormal with the given median and standard deviation."""
+    # std^2 = median^2 * w * (w - 1) with w = exp(sigma^2)
+    ratio = std / median
+    w = (1 + np.sqrt(1 + 4 * ratio ** 2)) / 2
+    return np.sqrt(np.log(w))
+
+
+def sample_reference(median, std, size, random_state=None):
+    rng = np.random.default_rng(random_state)
+    return rng.lognormal(np.log(median), lognormal_sigma(median, std), size)
+
+
+def sample_sources(size, random_state=None):
+    """Samples for every SBSP configuration and every reference source."""
+    rng = np.random.default_rng(random_state)
+    samples = {name: run_monte_carlo(params, size=size, random_state=rng)
+               for name, params in configurations.items()}
+    for name, (median, std) in reference_sources.items():
+        samples[name] = sample_reference(median, std, size, random_state=rng)
+    return samples
+
+
+#  Sorted-array comparisons
+def exceedance(sorted_samples, thresholds):
+    """P(X > t) for each threshold, from an ascending sample array."""
+    counts = np.searchsorted(sorted_samples, thresholds, side='right')
+    return 1 - counts / sorted_samples.shape[0]
+
+
+def probability_less(sorted_a, sorted_b):
+    """P(A < B) for independent A and B, via one searchsorted of A into B."""
+    n_a, n_b = sorted_a.shape[0], sorted_b.shape[0]
+
+    # Only the part of A that overlaps the range of B needs searching
+    lo = np.searchsorted(sorted_a, sorted_b[0], side='left')
+    hi = np.searchsorted(sorted_a, sorted_b[-1], side='right')
+    overlap = sorted_a[lo:hi]
+
+    # For each a, the number of b strictly greater than a
+    greater = n_b - np.searchsorted(sorted_b, overlap, side='right')
+    total = lo * float(n_b) + np.sum(greater, dtype=np.float64)
+    return total / (float(n_a) * n_b)
+
+
+def compare_sources(samples, n_grid=500):
+    """Exceedance curves, pairwise P(row < column) and expected rank (1 = lowest).
+
+    Every source is sorted once, so the whole comparison costs O(N log N) per source
+    rather than O(N^2) per pair.
+    """
+    names = list(samples)
+    sorted_samples = {name: np.sort(np.asarray(samples[name]).ravel()) for name in names}
+
+    lowest = min(max(s[0], 1e-3) for s in sorted_samples.values())
+    highest = max(s[-1] for s in sorted_samples.values())
+    grid = np.geomspace(lowest, highest, n_grid)
+    curves = np.vstack([exceedance(sorted_samples[name], grid) for name in names])
+
+    # Samples are continuous, so P(B < A) = 1 - P(A < B) and only half the pairs are searched
+    n = len(names)
+    p_less = np.full((n, n), np.nan)
+    for i in range(n):
+        for j in range(i + 1, n):
+            p_less[i, j] = probability_less(sorted_samples[names[i]], sorted_samples[names[j]])
+            p_less[j, i] = 1 - p_less[i, j]
+
+    # Rank of source i is 1 plus the number of sources below it
+    expected_rank = 1 + np.nansum(p_less.T, axis=1)
+    return {
+        "names": names,
+        "grid": grid,
+        "exceedance": curves,
+        "p_less": p_less,
+        "expected_rank": expected_rank
+    }
+
+
+def plot_comparison(comparison):
+    names = comparison["names"]
+    fig, axes = plt.subplots(1, 2, figsize=(16, 6))
+
+    ax = axes[0]
+    for name, curve in zip(names, comparison["exceedance"]):
+        linestyle = '-' if name in configurations else '--'
+        ax.plot(comparison["grid"], curve, linestyle=linestyle, label=name)
+    ax.set_xscale('log')
+    ax.set_title("a) Exceedance Curves")
+    ax.set_xlabel("g CO₂e per kWh")
+    ax.set_ylabel("P(emissions > x)")
+    ax.grid(True, which='both', alpha=0.5)
+    ax.legend(fontsize=8)
+
+    ax = axes[1]
+    image = ax.imshow(comparison["p_less"], cmap='RdBu', vmin=0, vmax=1)
+    ax.set_xticks(range(len(names)), names, rotation=45, ha='right')
+    ax.set_yticks(range(len(names)),
+                  [f"{name} (E[rank] = {rank:.2f})"
+                   for name, rank in zip(names, comparison["expected_rank"])])
+    ax.set_title("b) P(row < column)")
+    fig.colorbar(image, ax=ax)
+
+    plt.tight_layout()
+    return fig
+
+
+if __name__ == "__main__":
+    import time
+
+    size = 10_000_000
+    samples = sample_sources(size, random_state=42)
+
+    start = time.perf_counter()
+    comparison = compare_sources(samples)
+    print(f"Compared {len(samples)} sources x {size:,} samples in "
+          f"{time.perf_counter() - start:.1f} s")
+
+    names = comparison["names"]
+    for i in np.argsort(comparison["expected_rank"]):
+        print(f"  {names[i]:<16} expected rank {comparison['expected_rank'][i]:.2f}")
+    for sbsp in configurations:
+        i = names.index(sbsp)
+        below = ", ".join(f"{names[j]} {comparison['p_less'][i, j]:.3f}"
+                          for j in range(len(names)) if names[j] in reference_sources)
+        print(f"  P({sbsp} < source): {below}")
+
+    plot_comparison(comparison)
+    plt.show()
@@ -0,0 +1,163 @@
+import hashlib
+import json
+import os
+import sqlite3
+from datetime import datetime, timezone
+
+# Default registry location, next to the scripts
+registry_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "runs.sqlite")
+
+summary_columns = {
+    "mean": "mean",
+    "median": "median",
+    "5th_percentile": "p5",
+    "95th_percentile": "p95",
+    "std": "std"
+}
+
+schema = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at TEXT NOT NULL,
+    configuration TEXT NOT NULL,
+    param_hash TEXT NOT NULL,
+    params TEXT NOT NULL,
+    std_frac TEXT,
+    seed INTEGER,
+    stream INTEGER,
+    n_samples INTEGER NOT NULL,
+    duration_s REAL,
+    mean REAL,
+    median REAL,
+    p5 REAL,
+    p95 REAL,
+    std REAL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_configuration ON runs (configuration, created_at);
+CREATE INDEX IF NOT EXISTS idx_runs_param_hash ON runs (param_hash, created_at);
+"""
+
+
+def _to_builtin(value):
+    # numpy scalars and arrays are not JSON serializable as-is
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def params_hash(params, std_frac=0.25):
+    """Stable hash of a parameter dict and the std_frac it was sampled with.
+
+    std_frac is a scalar or a per-input dict, as taken by run_monte_carlo; the hash
+    is independent of key order.
+    """
+    encoded = json.dumps({"params": params, "std_frac": std_frac}, sort_keys=True,
+                         default=_to_builtin)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def connect(path=None):
+    conn = sqlite3.connect(path or registry_path)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(schema)
+
+    # Registries created before the stream and std_frac columns existed. Older rows
+    # keep std_frac NULL and a hash of params alone, so they never match a params filter
+    existing = {row["name"] for row in conn.execute("PRAGMA table_info(runs)")}
+    for column, column_type in (("stream", "INTEGER"), ("std_frac", "TEXT")):
+        if column not in existing:
+            with conn:
+                conn.execute(f"ALTER TABLE runs ADD COLUMN {column} {column_type}")
+    return conn
+
+
+def record_run(conn, configuration, params, summary, n_samples, std_frac=0.25, seed=None,
+               stream=None, duration_s=None):
+    """Store one run's inputs and summary statistics, returning its row id.
+
+    seed and stream identify the random stream: SeedSequence(seed, spawn_key=(stream,)).
+    """
+    row = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "configuration": configuration,
+        "param_hash": params_hash(params, std_frac),
+        "params": json.dumps(params, sort_keys=True, default=_to_builtin),
+        "std_frac": json.dumps(std_frac, sort_keys=True, default=_to_builtin),
+        "seed": seed,
+        "stream": stream,
+        "n_samples": int(n_samples),
+        "duration_s": duration_s
+    }
+    for key, column in summary_columns.items():
+        row[column] = float(summary[key]) if key in summary else None
+
+    columns = ", ".join(row)
+    placeholders = ", ".join(f":{c}" for c in row)
+    with conn:
+        cursor = conn.execute(f"INSERT INTO runs ({columns}) VALUES ({placeholders})", row)
+    return cursor.lastrowid
+
+
+def _row_to_summary(row):
+    return {key: row[column] for key, column in summary_columns.items()}
+
+
+def query_runs(conn, configuration=None, params=None, std_frac=0.25, limit=None):
+    """Runs matching a configuration and/or exact parameter set and std_frac, newest first."""
+    clauses, args = [], []
+    if configuration is not None:
+        clauses.append("configuration = ?")
+        args.append(configuration)
+    if params is not None:
+        clauses.append("param_hash = ?")
+        args.append(params_hash(params, std_frac))
+
+    sql = "SELECT * FROM runs"
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+    sql += " ORDER BY created_at DESC, id DESC"
+    if limit is not None:
+        sql += " LIMIT ?"
+        args.append(int(limit))
+    return [dict(row) for row in conn.execute(sql, args)]
+
+
+def latest_summaries(conn, configurations=None, params=None, std_frac=0.25, min_samples=None):
+    """Most recent summary statistics for each configuration.
+
+    params maps configuration names to their expected parameter dicts; runs with a
+    different parameter dict or std_frac, or fewer than min_samples samples, are
+    ignored.
+    """
+    if configurations is None:
+        configurations = params if params is not None else [
+            row["configuration"] for row in conn.execute("SELECT DISTINCT configuration FROM runs")
+        ]
+
+    # One indexed lookup per configuration
+    summaries = {}
+    for name in configurations:
+        clauses, args = ["configuration = ?"], [name]
+        if params is not None:
+            if name not in params:
+                continue
+            clauses.append("param_hash = ?")
+            args.append(params_hash(params[name], std_frac))
+        if min_samples is not None:
+            clauses.append("n_samples >= ?")
+            args.append(int(min_samples))
+        row = conn.execute(
+            f"SELECT * FROM runs WHERE {' AND '.join(clauses)} "
+            "ORDER BY created_at DESC, id DESC LIMIT 1", args
+        ).fetchone()
+        if row is not None:
+            summaries[name] = _row_to_summary(row)
+    return summaries
+
+
+if __name__ == "__main__":
+    conn = connect()
+    for run in query_runs(conn, limit=20):
+        print(f"{run['created_at']}  {run['configuration']:<16} n={run['n_samples']:<9} "
+              f"median={run['median']:.2f}  mean={run['mean']:.2f}  "
+              f"[{run['p5']:.2f}, {run['p95']:.2f}]  {run['duration_s'] or 0:.3f}s")
@@ -0,0 +1,110 @@
+import numpy as np
+import matplotlib.pyplot as plt
+
+from Monte_Carlo_Simulation import (
+    capacity_factor, configurations, sample_bounded, sample_trunc_normal
+)
+
+# Setup
+percent_changes = [-60, -50, -40, -30, -20, 0, 20, 30, 40, 50, 60]
+input_keys = ["energy_output", "launch_emissions", "satellite_emissions", "rectenna_emissions"]
+
+# Parameters perturbed one at a time, with their axis labels
+parameters = {
+    "launch_emissions": "Launch Emissions Change (%)",
+    "satellite_emissions": "Satellite Emissions Change (%)",
+    "rectenna_emissions": "Rectenna Emissions Change (%)",
+    "energy_output": "Energy Output Change (%)",
+    "capacity_factor": "Capacity Factor Change (%)"
+}
+
+colors = {
+    "Starship (Si)": "blue",
+    "Starship (GaAs)": "skyblue",
+    "Falcon9 (Si)": "red",
+    "Falcon9 (GaAs)": "orange"
+}
+
+
+def draw_base_samples(size=10000, random_state=None):
+    """One set of input draws per configuration, shaped (n_configs, size) per input.
+
+    A capacity factor is drawn as well, independently of energy_output. It is used
+    only to decide when a capacity-factor increase saturates at 1; the energy
+    sample itself is rescaled by the resulting relative change.
+    """
+    rng = np.random.default_rng(random_state)
+    base = {
+        key: np.vstack([sample_trunc_normal(params[key], size=size, random_state=rng)
+                        for params in configurations.values()])
+        for key in input_keys
+    }
+    base["capacity_factor"] = np.vstack([sample_bounded(*capacity_factor, size, random_state=rng)
+                                         for _ in configurations])
+    return base
+
+
+def stochastic_sensitivity(base, changes=percent_changes, quantiles=(5, 50, 95),
+                           max_elements=50_000_000):
+    """Percentiles of g CO2e/kWh at every (parameter, step, configuration).
+
+    The same base draws are reused at every step, and steps are evaluated in
+    vectorized chunks of at most max_elements values. Returns an array of shape
+    (n_parameters, n_steps, n_configs, n_quantiles).
+    """
+    factors = 1 + np.asarray(changes, dtype=float) / 100
+    n_configs, size = base["energy_output"].shape
+    total = base["launch_emissions"] + base["satellite_emissions"] + base["rectenna_emissions"]
+    energy = base["energy_output"]
+
+    out = np.empty((len(parameters), factors.shape[0], n_configs, len(quantiles)))
+    steps_per_chunk = max(1, max_elements // (n_configs * size))
+
+    for p, param in enumerate(parameters):
+        for start in range(0, factors.shape[0], steps_per_chunk):
+            f = factors[start:start + steps_per_chunk, None, None]
+            if param == "energy_output":
+                g = total / (energy * f) * 1000
+            elif param == "capacity_factor":
+                # Energy scales with the capacity factor, which cannot exceed 1
+                cf = base["capacity_factor"]
+                g = total / (energy * (np.minimum(cf * f, 1) / cf)) * 1000
+            else:
+                g = (total + (f - 1) * base[param]) / energy * 1000
+            out[p, start:start + f.shape[0]] = np.moveaxis(
+                np.percentile(g, quantiles, axis=-1), 0, -1)
+    return out
+
+
+def plot_bands(bands, changes=percent_changes):
+    fig, axes = plt.subplots(1, len(parameters), figsize=(24, 5), sharey=True)
+    fig.suptitle("Emissions Sensitivity with Propagated Uncertainty (median, 5–95%)",
+                 fontsize=14)
+
+    for p, (ax, label) in enumerate(zip(axes, parameters.values())):
+        for c, name in enumerate(configurations):
+            p5, p50, p95 = bands[p, :, c].T
+            ax.fill_between(changes, p5, p95, color=colors[name], alpha=0.15)
+            ax.plot(changes, p50, marker='o', color=colors[name], label=name)
+        ax.set_xlabel(label)
+        ax.grid(True)
+
+    axes[0].set_ylabel("g CO₂e per kWh")
+    axes[0].legend()
+    plt.tight_layout(rect=[0, 0.03, 1, 0.95])
+    return fig
+
+
+if __name__ == "__main__":
+    base = draw_base_samples(random_state=42)
+    bands = stochastic_sensitivity(base)
+
+    for p, param in enumerate(parameters):
+        print(f"\n{parameters[param].replace(' Change (%)', '')}: median [5th, 95th] at -60% / +60%")
+        for c, name in enumerate(configurations):
+            low, high = bands[p, 0, c], bands[p, -1, c]
+            print(f"  {name}: {low[1]:.2f} [{low[0]:.2f}, {low[2]:.2f}] / "
+                  f"{high[1]:.2f} [{high[0]:.2f}, {high[2]:.2f}]")
+
+    plot_bands(bands)
+    plt.show()
@@ -0,0 +1,246 @@
+import itertools
+import warnings
+from math import factorial
+
+import numpy as np
+from scipy.integrate import quad
+from scipy.special import ndtr, ndtri
+from scipy.stats import truncnorm
+
+from Monte_Carlo_Simulation import (
+    configurations, run_monte_carlo, trunc_normal_cdf, trunc_normal_ppf, truncation_lower
+)
+
+# Model inputs, in the order of the standard-normal variables. The model is
+# g = 1000 * (launch + satellite + rectenna) / energy, so only the emissions
+# numerator is expanded in polynomial chaos; 1/energy is kept exact, because its
+# tail near the truncation bound cannot be followed by any polynomial.
+input_keys = ["energy_output", "launch_emissions", "satellite_emissions", "rectenna_emissions"]
+numerator_keys = input_keys[1:]
+
+
+#  Polynomial chaos basis
+def total_degree_indices(n_inputs, degree):
+    """Multi-indices of total degree <= degree, constant term first."""
+    indices = [
+        alpha for alpha in itertools.product(range(degree + 1), repeat=n_inputs)
+        if sum(alpha) <= degree
+    ]
+    indices.sort(key=lambda alpha: (sum(alpha), tuple(-a for a in alpha)))
+    return np.array(indices, dtype=np.int64)
+
+
+def hermite_table(xi, degree):
+    """Orthonormal probabilists' Hermite polynomials He_n(xi)/sqrt(n!) for n <= degree.
+
+    xi has shape (n_inputs, n_points); the result has shape (n_inputs, degree + 1, n_points).
+    """
+    table = np.empty((xi.shape[0], degree + 1, xi.shape[1]))
+    table[:, 0] = 1.0
+    if degree >= 1:
+        table[:, 1] = xi
+    for n in range(1, degree):
+        table[:, n + 1] = xi * table[:, n] - n * table[:, n - 1]
+    norms = np.sqrt([factorial(n) for n in range(degree + 1)])
+    return table / norms[None, :, None]
+
+
+def basis_values(xi, multi_indices):
+    """Basis polynomials at xi of shape (n_points, n_inputs), as (n_terms, n_points)."""
+    table = hermite_table(np.asarray(xi, dtype=float).T, int(multi_indices.max()))
+    psi = table[0][multi_indices[:, 0]]
+    for i in range(1, table.shape[0]):
+        psi *= table[i][multi_indices[:, i]]
+    return psi
+
+
+#  Isoprobabilistic transform between standard normal and model inputs
+def to_inputs(params, xi, std_frac=0.25):
+    u = np.clip(ndtr(xi), np.finfo(float).tiny, 1 - np.finfo(float).eps)
+    return {key: trunc_normal_ppf(u[:, i], params[key], std_frac)
+            for i, key in enumerate(input_keys)}
+
+
+def to_standard_normal(params, inputs, std_frac=0.25):
+    u = np.column_stack([trunc_normal_cdf(np.asarray(inputs[key], dtype=float),
+                                          params[key], std_frac)
+                         for key in input_keys])
+    return ndtri(np.clip(u, np.finfo(float).tiny, 1 - np.finfo(float).eps))
+
+
+def inverse_energy_moments(mean, std_frac, tail_probability=0.0):
+    """E[1/energy] and E[1/energy^2] by quadrature over the truncated normal.
+
+    With tail_probability > 0 the moments are conditional on energy above its
+    tail_probability quantile, i.e. on the range a sample of about
+    1/tail_probability draws reaches. Integrated in log(energy) so the region
+    near the lower limit, which dominates the second moment, is resolved.
+    """
+    std_dev = mean * std_frac
+    a = (truncation_lower - mean) / std_dev
+    lower = (trunc_normal_ppf(tail_probability, mean, std_frac) if tail_probability > 0
+             else truncation_lower)
+    lowest = max(mean - 3.9 * std_dev, 2.0 * lower)
+    edges = np.log(np.concatenate([[lower], np.linspace(lowest, mean + 12 * std_dev, 33)]))
+
+    result = []
+    for k in (1, 2):
+        def integrand(t):
+            return np.exp((1 - k) * t) * truncnorm.pdf(np.exp(t), a, np.inf,
+                                                       loc=mean, scale=std_dev)
+        result.append(sum(quad(integrand, lo, hi, epsabs=0, epsrel=1e-10, limit=200)[0]
+                          for lo, hi in zip(edges[:-1], edges[1:])))
+    return np.array(result) / (1 - tail_probability)
+
+
+#  Fitting
+def fit_surrogate(params, degree=2, n_train=2000, n_validation=4000, std_frac=0.25,
+                  tolerance=0.01, tail_probability=1e-4, random_state=None):
+    """Fit g = 1000 * numerator(xi_launch, xi_satellite, xi_rectenna) / energy(xi_energy).
+
+    The numerator is a least-squares polynomial chaos expansion of the emissions
+    total implied by run_monte_carlo; energy uses its exact inverse CDF. Warns if
+    the held-out relative RMSE exceeds tolerance, or if the moments used by
+    moments() and sobol_indices(), which are conditional on energy above its
+    tail_probability quantile, differ from the full-range ones by more than
+    tolerance.
+    """
+    rng = np.random.default_rng(random_state)
+    multi_indices = total_degree_indices(len(numerator_keys), degree)
+    if n_train < multi_indices.shape[0]:
+        raise ValueError(f"n_train must be at least the number of terms ({multi_indices.shape[0]})")
+
+    xi_train = rng.standard_normal((n_train, len(input_keys)))
+    inputs = to_inputs(params, xi_train, std_frac)
+    y_train = run_monte_carlo(params, samples=inputs)
+    numerator = y_train * inputs["energy_output"] / 1000
+    coefficients, *_ = np.linalg.lstsq(basis_values(xi_train[:, 1:], multi_indices).T,
+                                       numerator, rcond=None)
+
+    surrogate = {
+        "coefficients": coefficients,
+        "multi_indices": multi_indices,
+        "means": np.array([params[key] for key in input_keys], dtype=float),
+        "std_frac": float(std_frac),
+        "tail_probability": float(tail_probability),
+        "inverse_energy_moments": inverse_energy_moments(params["energy_output"], std_frac,
+                                                         tail_probability)
+    }
+
+    # The 1/energy^2 moment over the full range is dominated by energies near the
+    # truncation bound, far below anything a run_monte_carlo sample reaches
+    full = inverse_energy_moments(params["energy_output"], std_frac)
+    tail_share = 1 - surrogate["inverse_energy_moments"][1] / full[1]
+    if tail_share > tolerance:
+        warnings.warn(f"{tail_share:.1%} of E[1/energy^2] lies below the energy "
+                      f"{tail_probability:g} quantile; moments and Sobol indices are "
+                      f"conditional on energy above it")
+
+    # Held-out error on fresh model evaluations
+    xi_val = rng.standard_normal((n_validation, len(input_keys)))
+    y_val = run_monte_carlo(params, samples=to_inputs(params, xi_val, std_frac))
+    residual = evaluate(surrogate, xi_val) - y_val
+    surrogate["validation_rmse"] = float(np.sqrt(np.mean(residual ** 2)))
+    surrogate["validation_relative_rmse"] = surrogate["validation_rmse"] / float(np.std(y_val))
+    surrogate["validation_median_relative_error"] = float(np.median(np.abs(residual) / y_val))
+    surrogate["validation_max_error"] = float(np.max(np.abs(residual)))
+    if surrogate["validation_relative_rmse"] > tolerance:
+        warnings.warn(f"Surrogate held-out relative RMSE "
+                      f"{surrogate['validation_relative_rmse']:.4f} exceeds {tolerance}; "
+                      f"moments and Sobol indices describe the surrogate, not the model")
+    return surrogate
+
+
+#  Evaluation
+def evaluate(surrogate, xi, chunk_size=65_536):
+    """Surrogate g CO2e/kWh at standard-normal points xi of shape (n_points, n_inputs)."""
+    xi = np.atleast_2d(np.asarray(xi, dtype=float))
+    out = np.empty(xi.shape[0])
+    energy_mean, std_frac = surrogate["means"][0], surrogate["std_frac"]
+    for start in range(0, xi.shape[0], chunk_size):
+        block = xi[start:start + chunk_size]
+        numerator = surrogate["coefficients"] @ basis_values(block[:, 1:],
+                                                             surrogate["multi_indices"])
+        energy = trunc_normal_ppf(ndtr(block[:, 0]), energy_mean, std_frac)
+        out[start:start + block.shape[0]] = numerator / energy * 1000
+    return out
+
+
+def evaluate_inputs(surrogate, inputs):
+    """Surrogate g CO2e/kWh at physical inputs given as arrays keyed like params."""
+    params = dict(zip(input_keys, surrogate["means"]))
+    return evaluate(surrogate, to_standard_normal(params, inputs, surrogate["std_frac"]))
+
+
+def sample(surrogate, size, random_state=None):
+    rng = np.random.default_rng(random_state)
+    return evaluate(surrogate, rng.standard_normal((size, len(input_keys))))
+
+
+#  Moments and Sobol indices from the coefficients and the exact 1/energy moments
+def moments(surrogate):
+    """Mean and std of g; numerator and 1/energy are independent, so they factorize.
+
+    Conditional on energy above its tail_probability quantile (see fit_surrogate).
+    """
+    c = surrogate["coefficients"]
+    m1, m2 = surrogate["inverse_energy_moments"]
+    variance = np.sum(c ** 2) * m2 - (c[0] * m1) ** 2
+    return {"mean": float(1000 * c[0] * m1), "std": float(1000 * np.sqrt(variance))}
+
+
+def sobol_indices(surrogate):
+    """First-order and total Sobol indices, conditional like moments()."""
+    c2 = surrogate["coefficients"] ** 2
+    m1, m2 = surrogate["inverse_energy_moments"]
+    active = surrogate["multi_indices"] > 0
+    numerator_variance = np.sum(c2[1:])
+    variance = np.sum(c2) * m2 - c2[0] * m1 ** 2
+
+    only_one = active.sum(axis=1) == 1
+    first_order = {"energy_output": float(c2[0] * (m2 - m1 ** 2) / variance)}
+    total = {"energy_output": float((variance - m1 ** 2 * numerator_variance) / variance)}
+    for i, key in enumerate(numerator_keys):
+        first_order[key] = float(m1 ** 2 * np.sum(c2[only_one & active[:, i]]) / variance)
+        total[key] = float(m2 * np.sum(c2[active[:, i]]) / variance)
+    return {"first_order": first_order, "total": total}
+
+
+#  Serialization
+def save_surrogate(surrogate, path):
+    np.savez(path, **surrogate)
+
+
+def load_surrogate(path):
+    with np.load(path) as data:
+        surrogate = {key: data[key] for key in data.files}
+    for key, value in surrogate.items():
+        if value.ndim == 0:
+            surrogate[key] = value.item()
+    return surrogate
+
+
+if __name__ == "__main__":
+    import time
+
+    for name, params in configurations.items():
+        surrogate = fit_surrogate(params, random_state=42)
+        stats = moments(surrogate)
+        sobol = sobol_indices(surrogate)
+
+        start = time.perf_counter()
+        draws = sample(surrogate, 2_000_000, random_state=0)
+        rate = draws.size / (time.perf_counter() - start)
+
+        print(f"\n{name} polynomial chaos surrogate (numerator degree "
+              f"{int(surrogate['multi_indices'].max())}, "
+              f"{surrogate['coefficients'].size} terms, exact 1/energy)")
+        print(f"  Mean: {stats['mean']:.2f}  Std: {stats['std']:.2f}  "
+              f"Median: {np.median(draws):.2f}  (energy above its "
+              f"{surrogate['tail_probability']:g} quantile)")
+        print(f"  Held-out relative RMSE: {surrogate['validation_relative_rmse']:.4f}, "
+              f"median relative error: {surrogate['validation_median_relative_error']:.4f}")
+        print(f"  Evaluation rate: {rate / 1e6:.1f} M points/s")
+        for key in input_keys:
+            print(f"  Sobol {key}: first order {sobol['first_order'][key]:.3f}, "
+                  f"total {sobol['total'][key]:.3f}")
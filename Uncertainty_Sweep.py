@@ -0,0 +1,87 @@
+import numpy as np
+import matplotlib.pyplot as plt
+from scipy.special import ndtri
+
+from Monte_Carlo_Simulation import configurations, trunc_normal_ppf
+
+# Setup
+std_fracs = np.linspace(0.05, 0.50, 91)
+input_keys = ["energy_output", "launch_emissions", "satellite_emissions", "rectenna_emissions"]
+quantiles = {"5th_percentile": 5, "median": 50, "95th_percentile": 95}
+
+colors = {
+    "Starship (Si)": "blue",
+    "Starship (GaAs)": "skyblue",
+    "Falcon9 (Si)": "red",
+    "Falcon9 (GaAs)": "orange"
+}
+
+
+def draw_uniform_base(size=100_000, random_state=None):
+    """Shared uniform draws, one independent row per configuration and input."""
+    rng = np.random.default_rng(random_state)
+    return {name: rng.random((len(input_keys), size)) for name in configurations}
+
+
+def sweep_std_frac(base, std_fracs=std_fracs, max_elements=20_000_000):
+    """Summary statistics of g CO2e/kWh for every std_frac from one set of draws.
+
+    Returns {configuration: {statistic: array over std_fracs}}.
+    """
+    summaries = {}
+    for name, u in base.items():
+        params = configurations[name]
+        z = ndtri(u)
+        size = u.shape[1]
+        stats = {key: np.empty(len(std_fracs)) for key in ["mean", "std"] + list(quantiles)}
+        per_chunk = max(1, max_elements // (len(input_keys) * size))
+
+        for start in range(0, len(std_fracs), per_chunk):
+            chunk = std_fracs[start:start + per_chunk]
+            # Inputs for every std_frac in the chunk, shaped (len(chunk), size)
+            x = {
+                key: np.vstack([trunc_normal_ppf(u[i], params[key], s, z=z[i])
+                                for s in chunk])
+                for i, key in enumerate(input_keys)
+            }
+            g = (x["launch_emissions"] + x["satellite_emissions"] +
+                 x["rectenna_emissions"]) / x["energy_output"] * 1000
+
+            stop = start + chunk.shape[0]
+            stats["mean"][start:stop] = np.mean(g, axis=1)
+            stats["std"][start:stop] = np.std(g, axis=1)
+            values = np.percentile(g, list(quantiles.values()), axis=1)
+            for key, row in zip(quantiles, values):
+                stats[key][start:stop] = row
+        summaries[name] = stats
+    return summaries
+
+
+def plot_sweep(summaries, std_fracs=std_fracs):
+    fig, ax = plt.subplots(figsize=(10, 6))
+    for name, stats in summaries.items():
+        ax.fill_between(std_fracs * 100, stats["5th_percentile"], stats["95th_percentile"],
+                        color=colors[name], alpha=0.15)
+        ax.plot(std_fracs * 100, stats["median"], color=colors[name], label=f"{name} median")
+    ax.set_title("Emissions vs Input Uncertainty (median, 5–95%)")
+    ax.set_xlabel("Input standard deviation (% of mean)")
+    ax.set_ylabel("g CO₂e per kWh")
+    ax.grid(True)
+    ax.legend()
+    plt.tight_layout()
+    return fig
+
+
+if __name__ == "__main__":
+    base = draw_uniform_base(random_state=42)
+    summaries = sweep_std_frac(base)
+
+    for name, stats in summaries.items():
+        print(f"\n{name}: median [5th, 95th] g CO₂e/kWh")
+        for s in (0.05, 0.25, 0.50):
+            i = int(np.argmin(np.abs(std_fracs - s)))
+            print(f"  std_frac {s:.2f}: {stats['median'][i]:.2f} "
+                  f"[{stats['5th_percentile'][i]:.2f}, {stats['95th_percentile'][i]:.2f}]")
+
+    plot_sweep(summaries)
+    plt.show()